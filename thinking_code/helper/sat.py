@@ -1,4 +1,5 @@
 from itertools import combinations
+import numpy as np
 from pysat.solvers import Solver
 
 def logic_expr_to_cnf_pattern(expr, symbol_list):
@@ -54,6 +55,53 @@ def nbit_sequence(n):
     cnfs_pattern = logic_expr_to_cnf_pattern(inc_expr, A + B)
     return cnfs_pattern  
 
+def rectangle_cover(board):
+    """
+    Enumerate the rectangles (x, y, w, h) that contain exactly one number of board
+    and whose area equals that number. The number of clues inside each candidate
+    is computed in O(1) with the 2-D prefix sums of the clue mask.
+
+    Returns rects, indptr, indices: rects is an (n, 4) array, and the candidates
+    covering cell (x, y) are indices[indptr[k]:indptr[k + 1]] with k = y * width + x,
+    i.e. the cell-by-candidate incidence matrix in CSR format.
+    """
+    board = np.asarray(board)
+    height, width = board.shape
+    counts = np.zeros((height + 1, width + 1), dtype=np.int64)
+    counts[1:, 1:] = (board > 0).cumsum(axis=0).cumsum(axis=1)
+
+    rects = []
+    for y, x in zip(*np.nonzero(board > 0)):
+        area = int(board[y, x])
+        for w in range(1, min(area, width) + 1):
+            h = area // w
+            if w * h != area or h > height:
+                continue
+            x0, y0 = np.meshgrid(np.arange(max(0, x - w + 1), min(x, width - w) + 1),
+                                 np.arange(max(0, y - h + 1), min(y, height - h) + 1))
+            x0, y0 = x0.ravel(), y0.ravel()
+            n = counts[y0 + h, x0 + w] - counts[y0, x0 + w] - counts[y0 + h, x0] + counts[y0, x0]
+            x0, y0 = x0[n == 1], y0[n == 1]
+            rects.append(np.column_stack([x0, y0, np.full_like(x0, w), np.full_like(y0, h)]))
+    rects = np.concatenate(rects) if rects else np.zeros((0, 4), dtype=np.int64)
+
+    cell_index = []
+    rect_index = []
+    for w, h in np.unique(rects[:, 2:], axis=0):
+        idx = np.nonzero((rects[:, 2] == w) & (rects[:, 3] == h))[0]
+        dy, dx = np.mgrid[:h, :w]
+        cells = (rects[idx, 1, None] + dy.ravel()) * width + rects[idx, 0, None] + dx.ravel()
+        cell_index.append(cells.ravel())
+        rect_index.append(np.repeat(idx, w * h))
+    cell_index = np.concatenate(cell_index) if cell_index else np.zeros(0, dtype=np.int64)
+    rect_index = np.concatenate(rect_index) if rect_index else np.zeros(0, dtype=np.int64)
+
+    order = np.argsort(cell_index, kind='stable')
+    indices = rect_index[order]
+    indptr = np.zeros(height * width + 1, dtype=np.int64)
+    indptr[1:] = np.bincount(cell_index, minlength=height * width).cumsum()
+    return rects, indptr, indices
+
 
 class SATHelper:
     def __init__(self):
@@ -78,6 +126,9 @@ class SATHelper:
         else:
             return self._get_variables(n)
 
+    def variables(self, n):
+        return self._get_variables(n)
+
     def _get_variables(self, n):
         n = int(n)
         variables = list(range(self.current, self.current + n))
@@ -98,6 +149,21 @@ class SATHelper:
 
         return cnfs
 
+    def exact_cover(self, indptr, indices, variables, extend=True):
+        """
+        Every row of the CSR incidence matrix (indptr, indices) is covered by
+        exactly one of variables.
+        """
+        variables = np.asarray(variables)
+        cnfs = []
+        for start, end in zip(indptr[:-1], indptr[1:]):
+            cnfs.extend(self.exact_n(variables[indices[start:end]], 1, extend=False))
+
+        if extend:
+            self.extend(cnfs)
+
+        return cnfs
+
     def atmost_one(self, variables, extend=True):
         variables = [int(v) for v in variables]
         cnfs = []